@@ -0,0 +1,12 @@
+"""Server entry point: ``python -m app``.
+
+Pool workers are started through forkserver/spawn, which re-import the
+launching script as ``__mp_main__``. Keeping the entry point this thin means
+that re-import is a no-op: FastMCP, tool registration and the thread pools in
+``app.main`` are only built in the server process.
+"""
+
+if __name__ == "__main__":
+    from app.main import main
+
+    main()
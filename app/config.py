@@ -11,6 +11,7 @@ Highlights:
 
 Environment variables (see .env.example for full list):
 - Logging: DEBUG (true/false)
+- Server: MAX_CONCURRENT_JOBS, MCP_WARMUP (true/false), MCP_EMAIL_YAML, MCP_DOCX_CACHE_SIZE
 - Storage generic: UPLOAD_STRATEGY, SIGNED_URL_EXPIRES_IN
 - Strategy specific: AWS_*, GCS_*, AZURE_*
 """
@@ -53,6 +54,18 @@ class LoggingSettings(BaseModel):
         return "debug" if self.debug else "info"
 
 
+class ServerSettings(BaseModel):
+    """Runtime limits for the MCP server process."""
+    max_concurrent_jobs: int = Field(default=4, gt=0, description="Maximum number of Word manipulation jobs processed at once")
+    warmup: bool = Field(default=True, description="Initialize the Office libraries in the background at startup")
+    email_templates_yaml: Optional[str] = Field(
+        default=None, description="Explicit path to the dynamic email templates YAML; skips path discovery"
+    )
+    docx_cache_size: int = Field(
+        default=2, ge=0, description="Parsed Word documents kept per worker process for repeated reads (0 disables)"
+    )
+
+
 class S3Settings(BaseModel):
     """Required credentials and configuration for AWS S3 uploads."""
     access_key: str
@@ -193,6 +206,7 @@ class Config(BaseModel):
     """Top-level configuration container used by the whole application."""
     logging: LoggingSettings
     storage: StorageSettings
+    server: ServerSettings = Field(default_factory=ServerSettings)
 
     @staticmethod
     def _parse_bool(value: Optional[str]) -> bool:
@@ -211,6 +225,26 @@ class Config(BaseModel):
         debug = cls._parse_bool(os.environ.get("DEBUG"))
         logging_settings = LoggingSettings(debug=debug)
 
+        # Server: concurrency cap for document jobs (fallback to 4 on invalid input)
+        try:
+            max_concurrent_jobs = int(os.environ.get("MAX_CONCURRENT_JOBS", "4"))
+            if max_concurrent_jobs <= 0:
+                raise ValueError
+        except ValueError:
+            max_concurrent_jobs = 4
+        try:
+            docx_cache_size = int(os.environ.get("MCP_DOCX_CACHE_SIZE", "2"))
+            if docx_cache_size < 0:
+                raise ValueError
+        except ValueError:
+            docx_cache_size = 2
+        server_settings = ServerSettings(
+            max_concurrent_jobs=max_concurrent_jobs,
+            warmup=cls._parse_bool(os.environ.get("MCP_WARMUP", "true")),
+            email_templates_yaml=os.environ.get("MCP_EMAIL_YAML") or None,
+            docx_cache_size=docx_cache_size,
+        )
+
         # Storage
         raw_strategy = (os.environ.get("UPLOAD_STRATEGY", "LOCAL")).upper()
         strategy = raw_strategy if raw_strategy in {e.value for e in StorageStrategy} else "LOCAL"
@@ -269,7 +303,7 @@ class Config(BaseModel):
         )
 
         try:
-            return cls(logging=logging_settings, storage=storage_settings)
+            return cls(logging=logging_settings, storage=storage_settings, server=server_settings)
         except ValidationError as e:
             # Wrap Pydantic validation errors in a simpler exception for callers
             raise ValueError(f"Invalid configuration: {e}")
@@ -1,39 +1,61 @@
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
-from typing import Annotated, List, Dict, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, List, Dict, Optional, Literal, Union
 from pathlib import Path
+from importlib.resources import files
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import functools
 import logging
+import multiprocessing
+import os
+import threading
 
 from .config import get_config
-from .tools.excel import markdown_to_excel
-from .tools.word import markdown_to_word
-from .tools.word import manipulation as word_ops
-from .tools.pptx import create_presentation
-from .tools.email import create_eml
-from .tools.email.dynamic_email_tools import register_email_template_tools_from_yaml
+from .workers import run_word_op
+from .tools.email.dynamic_email_tools import (
+    load_email_templates_yaml,
+    register_email_template_tools_from_dict,
+)
 mcp = FastMCP("MCP Office Documents")
 
 # Initialize config and logging
 config = get_config()
+_LOG_LEVEL = config.logging.mcp_level_str
 logger = logging.getLogger(__name__)
 
 # Look for dynamic email templates in production and local locations.
 # Production (container): /app/config/email_templates.yaml
 # Local development: <project_root>/config/email_templates.yaml
-APP_CONFIG_PATH = Path("/app/config") / "email_templates.yaml"
-LOCAL_CONFIG_PATH = Path(__file__).resolve().parent / "config" / "email_templates.yaml"
-
-# Prefer the production path when present, otherwise fall back to local config.
-_primary_yaml = None
-for candidate in (APP_CONFIG_PATH, LOCAL_CONFIG_PATH):
-    if candidate.exists():
-        _primary_yaml = candidate
+APP_CONFIG_PATH = Path("/app/config/email_templates.yaml")
+LOCAL_CONFIG_PATH = Path(files("app").joinpath("config", "email_templates.yaml"))
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_template_path() -> Optional[Path]:
+    """Use MCP_EMAIL_YAML when set; else prefer the production path, falling back to local config."""
+    explicit = config.server.email_templates_yaml
+    if explicit:
+        if os.path.isfile(explicit):
+            logger.info("[dynamic-email] Using email templates file from MCP_EMAIL_YAML: %s", explicit)
+            return Path(explicit)
+        logger.warning("[dynamic-email] MCP_EMAIL_YAML points to a missing file (%s); searching default locations", explicit)
+
+    for candidate in (APP_CONFIG_PATH, LOCAL_CONFIG_PATH):
+        try:
+            os.stat(candidate)
+        except FileNotFoundError:
+            continue
         logger.info("[dynamic-email] Found email templates file: %s", candidate)
-        break
+        return candidate
+    return None
+
 
+_primary_yaml = _resolve_template_path()
 if _primary_yaml:
     try:
-        register_email_template_tools_from_yaml(mcp, _primary_yaml)
+        register_email_template_tools_from_dict(mcp, load_email_templates_yaml(_primary_yaml))
     except Exception as e:
         logger.exception("[dynamic-email] Failed to register email templates from %s: %s", _primary_yaml, e)
 else:
@@ -41,8 +63,172 @@ else:
         "[dynamic-email] No dynamic email templates file found at /app/config/email_templates.yaml or config/email_templates.yaml - skipping"
     )
 
+# Office backends are imported on first use so `import app.main` stays light:
+# python-docx, openpyxl, python-pptx and msoffcrypto load only when a tool needs them.
+@functools.lru_cache(maxsize=1)
+def _markdown_to_excel():
+    from .tools.excel import markdown_to_excel
+    return markdown_to_excel
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_to_word():
+    from .tools.word.creation import markdown_to_word
+    return markdown_to_word
+
+
+@functools.lru_cache(maxsize=1)
+def _word_ops():
+    from .tools.word import manipulation
+    return manipulation
+
+
+@functools.lru_cache(maxsize=1)
+def _create_presentation():
+    from .tools.pptx import create_presentation
+    return create_presentation
+
+
+@functools.lru_cache(maxsize=1)
+def _create_eml():
+    from .tools.email import create_eml
+    return create_eml
+
+
+# Upper bound for markdown payloads accepted by the converter tools (characters).
+MAX_MARKDOWN_LENGTH = 10_000_000
+
+# Tool tags, built once at import and shared with the tool registrations below.
+_EXCEL_TAGS = frozenset({"excel", "spreadsheet", "data"})
+_WORD_TAGS = frozenset({"word", "document", "text", "legal", "contract"})
+_POWERPOINT_TAGS = frozenset({"powerpoint", "presentation", "slides"})
+_EMAIL_TAGS = frozenset({"email", "eml", "communication"})
+
+# Prefixes of the error strings returned to the client by the creator tools.
+_ERR_EXCEL = "Error creating Excel document: "
+_ERR_WORD = "Error creating Word document: "
+_ERR_POWERPOINT = "Error creating PowerPoint presentation: "
+_ERR_EMAIL = "Error creating email draft: "
+
+# Worker processes for CPU-bound work: the openpyxl/python-docx/python-pptx converters
+# and the Word manipulation ops.
+# Running them inline would block the event loop and serialize concurrent requests.
+# The pool is created on first use so importing this module does not spawn processes,
+# and rebuilt if a worker dies (e.g. OOM-killed on a huge document).
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+# Modules imported once in the forkserver so every worker forked from it starts warm.
+_WORKER_PRELOAD = [
+    "app.workers",
+    "app.tools.excel",
+    "app.tools.word.creation",
+    "app.tools.word.manipulation",
+    "app.tools.pptx",
+]
+
+# Threads for the I/O-bound Word ops (see _IO_WORD_OPS). Kept separate from asyncio's
+# default executor so long conversions cannot starve other to_thread users; threads
+# are only started once work is submitted.
+_DOCX_POOL = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 4), thread_name_prefix="docx")
+
+
+# Background thread that pre-initializes the Office libraries (see _start_warmup).
+_WARMUP_THREAD: Optional[threading.Thread] = None
+
+
+def _warmup() -> None:
+    """Import the backends and build throwaway documents so first-use initialization is paid up front."""
+    try:
+        import docx
+        import openpyxl
+        import pptx
+
+        for backend in (_markdown_to_excel, _markdown_to_word, _create_presentation, _create_eml, _word_ops):
+            backend()
+        docx.Document()
+        openpyxl.Workbook()
+        pptx.Presentation()
+        # Start the forkserver (it preloads the backends) and a first worker now,
+        # rather than on the first CPU-bound request.
+        _get_process_pool().submit(os.getpid).result()
+        logger.debug("Office libraries warmed up")
+    except Exception:
+        logger.debug("Office library warm-up failed", exc_info=True)
+
+
+def _start_warmup() -> None:
+    """Run _warmup in a daemon thread unless disabled via MCP_WARMUP."""
+    global _WARMUP_THREAD
+    if config.server.warmup and _WARMUP_THREAD is None:
+        _WARMUP_THREAD = threading.Thread(target=_warmup, name="office-warmup", daemon=True)
+        _WARMUP_THREAD.start()
+
+
+def _worker_context():
+    """Multiprocessing context for the pool.
+
+    Forking the threaded server (uvicorn, the docx threads, the warm-up thread) can
+    copy a lock held by another thread into the child and deadlock it, so workers
+    come from a forkserver (or are spawned where that is unavailable).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(_WORKER_PRELOAD)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared converter process pool, creating it on first use."""
+    global _PROCESS_POOL
+    # Let the parent-side warm-up finish before starting worker machinery. Joined
+    # outside the lock: the warm-up itself ends by calling this function.
+    if _WARMUP_THREAD is not None and _WARMUP_THREAD is not threading.current_thread():
+        _WARMUP_THREAD.join()
+    with _POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_worker_context())
+        return _PROCESS_POOL
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next job starts a fresh one."""
+    global _PROCESS_POOL
+    with _POOL_LOCK:
+        if _PROCESS_POOL is pool:
+            _PROCESS_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Caps how many Word manipulation jobs run at once; each one holds a whole .docx in memory.
+_JOB_SEM = asyncio.Semaphore(config.server.max_concurrent_jobs)
+
+
+async def _run_in_process(fn, *args):
+    """Run a blocking function in the process pool and await its result.
+
+    Getting the pool and submitting happen off the event loop: the first call may
+    wait for the warm-up thread and for workers to be started.
+
+    A worker dying mid-job breaks the whole executor; the pool is then replaced so
+    later requests keep working, and the failure is reported for this one.
+    """
+    pool = _PROCESS_POOL or await asyncio.to_thread(_get_process_pool)
+    try:
+        future = await asyncio.to_thread(pool.submit, fn, *args)
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        logger.error("Worker process died; restarting the process pool")
+        _discard_process_pool(pool)
+        raise
+
+
 class PowerPointSlide(BaseModel):
     """PowerPoint slide - can be title, section, or content slide based on slide_type."""
+    # Slides are never modified after validation; freezing enforces that.
+    model_config = ConfigDict(frozen=True)
+
     slide_type: Literal["title", "section", "content"] = Field(description="Type of slide: 'title' for presentation opening, 'section' for dividers, 'content' for slide with bullet points")
     slide_title: str = Field(description="Title text for the slide")
 
@@ -53,187 +239,323 @@ class PowerPointSlide(BaseModel):
         description="Array of bullet points for content slides. Each bullet point must have 'text' (string) and 'indentation_level' (integer 1-5). Leave empty/null for title and section slides."
     )
 
+
+# Compiled once at import so the first presentation request does not pay for schema construction.
+_SLIDES_ADAPTER = TypeAdapter(List[PowerPointSlide])
+
 @mcp.tool(
     name="create_excel_from_markdown",
     description="Converts markdown content with tables and formulas to Excel (.xlsx) format.",
-    tags={"excel", "spreadsheet", "data"},
+    tags=_EXCEL_TAGS,
     annotations={"title": "Markdown to Excel Converter"}
 )
 async def create_excel_document(
-    markdown_content: Annotated[str, Field(description="Markdown content containing tables, headers, and formulas. Use T1.B[0] for cross-table references and B[0] for current row references. ALWAYS use [0], [1], [2] notation, NEVER use absolute row numbers like B2, B3. Do NOT count table header as first row, first row has index [0]. Supports cell formatting: **bold**, *italic*.")]
+    markdown_content: Annotated[str, Field(max_length=MAX_MARKDOWN_LENGTH, description="Markdown content containing tables, headers, and formulas. Use T1.B[0] for cross-table references and B[0] for current row references. ALWAYS use [0], [1], [2] notation, NEVER use absolute row numbers like B2, B3. Do NOT count table header as first row, first row has index [0]. Supports cell formatting: **bold**, *italic*.")]
 ) -> str:
     """
     Converts markdown to Excel with advanced formula support.
     """
 
+    # Nothing to convert: answer without starting a worker or building an empty workbook
+    if not markdown_content.strip():
+        return _ERR_EXCEL + "markdown content is empty"
+
     logger.info("Converting markdown to Excel document")
 
     try:
-        result = markdown_to_excel(markdown_content)
+        result = await _run_in_process(_markdown_to_excel(), markdown_content)
         logger.info("Excel document uploaded successfully")
         return result
+    except (ValueError, OSError) as e:
+        # Expected failures (bad input, missing template/file): no traceback needed.
+        logger.warning("Error creating Excel document: %s", e)
+        return _ERR_EXCEL + str(e)
     except Exception as e:
-        logger.error(f"Error creating Excel document: {e}")
-        return f"Error creating Excel document: {str(e)}"
+        logger.exception("Error creating Excel document")
+        return _ERR_EXCEL + str(e)
 
 @mcp.tool(
     name="create_word_from_markdown",
     description="Converts markdown content to Word (.docx) format. Supports headers, tables, lists, formatting, hyperlinks, and block quotes.",
-    tags={"word", "document", "text", "legal", "contract"},
+    tags=_WORD_TAGS,
     annotations={"title": "Markdown to Word Converter"}
 )
 async def create_word_document(
-    markdown_content: Annotated[str, Field(description="Markdown content. For LEGAL CONTRACTS use numbered lists (1., 2., 3.) for sections and nested lists for provisions - DO NOT use headers (except for contract title). For other documents use headers (# ## ###).")]
+    markdown_content: Annotated[str, Field(max_length=MAX_MARKDOWN_LENGTH, description="Markdown content. For LEGAL CONTRACTS use numbered lists (1., 2., 3.) for sections and nested lists for provisions - DO NOT use headers (except for contract title). For other documents use headers (# ## ###).")]
 ) -> str:
     """
     Converts markdown to professionally formatted Word document.
 
     """
 
+    if not markdown_content.strip():
+        return _ERR_WORD + "markdown content is empty"
+
     logger.info("Converting markdown to Word document")
 
     try:
-        result = markdown_to_word(markdown_content)
+        result = await _run_in_process(_markdown_to_word(), markdown_content)
         logger.info("Word document uploaded successfully")
         return result
+    except (ValueError, OSError) as e:
+        logger.warning("Error creating Word document: %s", e)
+        return _ERR_WORD + str(e)
     except Exception as e:
-        logger.error(f"Error creating Word document: {e}")
-        return f"Error creating Word document: {str(e)}"
-
-
-def register_word_manipulation_tools():
-    """Register advanced Word manipulation tools from word_ops module."""
-
-    @mcp.tool(name="word_create_document", description="Create a new Word document with optional metadata.")
-    async def word_create_document(filename: str, title: Optional[str] = None, author: Optional[str] = None) -> str:
-        return await word_ops.create_document(filename, title, author)
-
-    @mcp.tool(name="word_list_documents", description="List Word documents in a directory.")
-    async def word_list_documents(directory: str = ".") -> str:
-        return await word_ops.list_available_documents(directory)
-
-    @mcp.tool(name="word_get_info", description="Get metadata information from a Word document.")
-    async def word_get_info(filename: str) -> str:
-        return await word_ops.get_document_info(filename)
-
-    @mcp.tool(name="word_get_outline", description="Get paragraph and table outline of a Word document.")
-    async def word_get_outline(filename: str) -> str:
-        return await word_ops.get_document_outline(filename)
-
-    @mcp.tool(name="word_get_text", description="Extract all text from a Word document.")
-    async def word_get_text(filename: str) -> str:
-        return await word_ops.get_document_text(filename)
-
-    @mcp.tool(name="word_copy_document", description="Copy a Word document.")
-    async def word_copy_document(source_filename: str, destination_filename: Optional[str] = None) -> str:
-        return await word_ops.copy_document(source_filename, destination_filename)
-
-    @mcp.tool(name="word_merge_documents", description="Merge multiple Word documents into one.")
-    async def word_merge_documents(target_filename: str, source_filenames: List[str], add_page_breaks: bool = True) -> str:
-        return await word_ops.merge_documents(target_filename, source_filenames, add_page_breaks)
-
-    @mcp.tool(name="word_add_paragraph", description="Add a paragraph with optional styling.")
-    async def word_add_paragraph(filename: str, text: str, style: Optional[str] = None,
-                                 font_name: Optional[str] = None, font_size: Optional[int] = None,
-                                 bold: Optional[bool] = None, italic: Optional[bool] = None, color: Optional[str] = None) -> str:
-        return await word_ops.add_paragraph(filename, text, style, font_name, font_size, bold, italic, color)
-
-    @mcp.tool(name="word_add_heading", description="Add a heading to a document.")
-    async def word_add_heading(filename: str, text: str, level: int = 1,
-                               font_name: Optional[str] = None, font_size: Optional[int] = None,
-                               bold: Optional[bool] = None, italic: Optional[bool] = None,
-                               border_bottom: bool = False) -> str:
-        return await word_ops.add_heading(filename, text, level, font_name, font_size, bold, italic, border_bottom)
-
-    @mcp.tool(name="word_add_table", description="Add a table to a document.")
-    async def word_add_table(filename: str, rows: int, cols: int, data: Optional[List[List[str]]] = None) -> str:
-        return await word_ops.add_table(filename, rows, cols, data)
-
-    @mcp.tool(name="word_search_replace", description="Search and replace text across paragraphs and tables.")
-    async def word_search_replace(filename: str, find_text: str, replace_text: str) -> str:
-        return await word_ops.search_and_replace(filename, find_text, replace_text)
-
-    @mcp.tool(name="word_insert_header_near_text", description="Insert a header before/after target text or paragraph index.")
-    async def word_insert_header_near_text(filename: str, target_text: Optional[str] = None, header_title: str = "",
-                                           position: str = 'after', header_style: str = 'Heading 1',
-                                           target_paragraph_index: Optional[int] = None) -> str:
-        return await word_ops.insert_header_near_text_tool(filename, target_text, header_title, position, header_style, target_paragraph_index)
-
-    @mcp.tool(name="word_insert_paragraph_near_text", description="Insert paragraph near target text or index.")
-    async def word_insert_paragraph_near_text(filename: str, target_text: Optional[str] = None, line_text: str = "",
-                                              position: str = 'after', line_style: Optional[str] = None,
-                                              target_paragraph_index: Optional[int] = None) -> str:
-        return await word_ops.insert_line_or_paragraph_near_text_tool(filename, target_text, line_text, position, line_style, target_paragraph_index)
-
-    @mcp.tool(name="word_insert_list_near_text", description="Insert bulleted/numbered list near target text or index.")
-    async def word_insert_list_near_text(filename: str, target_text: Optional[str] = None, list_items: Optional[List[str]] = None,
-                                         position: str = 'after', target_paragraph_index: Optional[int] = None,
-                                         bullet_type: str = 'bullet') -> str:
-        return await word_ops.insert_numbered_list_near_text_tool(filename, target_text, list_items, position, target_paragraph_index, bullet_type)
-
-    @mcp.tool(name="word_format_text", description="Format a specific range in a paragraph.")
-    async def word_format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int,
-                               bold: Optional[bool] = None, italic: Optional[bool] = None,
-                               underline: Optional[bool] = None, color: Optional[str] = None,
-                               font_size: Optional[int] = None, font_name: Optional[str] = None) -> str:
-        return await word_ops.format_text(filename, paragraph_index, start_pos, end_pos, bold, italic, underline, color, font_size, font_name)
-
-    @mcp.tool(name="word_create_custom_style", description="Create a custom text style in the document.")
-    async def word_create_custom_style(filename: str, style_name: str, bold: Optional[bool] = None,
-                                       italic: Optional[bool] = None, font_size: Optional[int] = None,
-                                       font_name: Optional[str] = None, color: Optional[str] = None,
-                                       base_style: Optional[str] = None) -> str:
-        return await word_ops.create_custom_style(filename, style_name, bold, italic, font_size, font_name, color, base_style)
-
-    @mcp.tool(name="word_protect_document", description="Protect a Word document with password or restrictions.")
-    async def word_protect_document(filename: str, password: str) -> str:
-        return await word_ops.protect_document(filename, password)
-
-    @mcp.tool(name="word_unprotect_document", description="Remove password protection from a Word document.")
-    async def word_unprotect_document(filename: str, password: str) -> str:
-        return await word_ops.unprotect_document(filename, password)
-
-    @mcp.tool(name="word_add_footnote", description="Add a footnote to a specific paragraph.")
-    async def word_add_footnote(filename: str, paragraph_index: int, footnote_text: str) -> str:
-        return await word_ops.add_footnote_to_document(filename, paragraph_index, footnote_text)
-
-    @mcp.tool(name="word_add_footnote_after_text", description="Add a footnote after a specific text.")
-    async def word_add_footnote_after_text(filename: str, search_text: str, footnote_text: str,
-                                           output_filename: Optional[str] = None) -> str:
-        return await word_ops.add_footnote_after_text(filename, search_text, footnote_text, output_filename)
-
-    @mcp.tool(name="word_add_footnote_before_text", description="Add a footnote before a specific text.")
-    async def word_add_footnote_before_text(filename: str, search_text: str, footnote_text: str,
-                                            output_filename: Optional[str] = None) -> str:
-        return await word_ops.add_footnote_before_text(filename, search_text, footnote_text, output_filename)
-
-    @mcp.tool(name="word_add_comment", description="Retrieve all comments from the document.")
-    async def word_get_all_comments(filename: str) -> str:
-        return await word_ops.get_all_comments(filename)
-
-    @mcp.tool(name="word_get_comments_by_author", description="Retrieve comments filtered by author.")
-    async def word_get_comments_by_author(filename: str, author: str) -> str:
-        return await word_ops.get_comments_by_author(filename, author)
-
-    @mcp.tool(name="word_get_comments_for_paragraph", description="Retrieve comments for a paragraph index.")
-    async def word_get_comments_for_paragraph(filename: str, paragraph_index: int) -> str:
-        return await word_ops.get_comments_for_paragraph(filename, paragraph_index)
-
-    @mcp.tool(name="word_find_text", description="Find occurrences of text with options.")
-    async def word_find_text(filename: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> str:
-        return await word_ops.find_text_in_document(filename, text_to_find, match_case, whole_word)
-
-    @mcp.tool(name="word_convert_to_pdf", description="Convert Word document to PDF.")
-    async def word_convert_to_pdf(filename: str, output_filename: Optional[str] = None) -> str:
-        return await word_ops.convert_to_pdf(filename, output_filename)
-
-
-register_word_manipulation_tools()
+        logger.exception("Error creating Word document")
+        return _ERR_WORD + str(e)
+
+
+# word_ops entry points that mostly wait on the filesystem or a subprocess. They run in
+# _DOCX_POOL (no pickling); everything else parses/serializes .docx XML and goes to the
+# process pool.
+_IO_WORD_OPS = frozenset({
+    "list_available_documents",
+    "copy_document",
+    "get_document_info",
+    "convert_to_pdf",
+    "convert_to_pdf_batch",
+})
+
+# LibreOffice conversions run one at a time (see extended_document_tools). They queue on
+# their own lock instead of holding _JOB_SEM slots, so a backlog of PDF requests cannot
+# stall the other Word tools.
+_PDF_WORD_OPS = frozenset({"convert_to_pdf", "convert_to_pdf_batch"})
+_PDF_LOCK = asyncio.Lock()
+
+
+async def _call_word_op(op_name: str, *args):
+    """Invoke ``word_ops.<op_name>`` under the job semaphore (PDF ops: the PDF lock).
+
+    Every Word manipulation tool funnels through here, so concurrency limits and
+    dispatch live in one place instead of being repeated in each wrapper.
+    """
+    async with (_PDF_LOCK if op_name in _PDF_WORD_OPS else _JOB_SEM):
+        if op_name in _IO_WORD_OPS:
+            return await asyncio.get_running_loop().run_in_executor(_DOCX_POOL, run_word_op, op_name, *args)
+        return await _run_in_process(run_word_op, op_name, *args)
+
+
+async def word_create_document(filename: str, title: Optional[str] = None, author: Optional[str] = None) -> str:
+    return await _call_word_op("create_document", filename, title, author)
+
+
+async def word_list_documents(directory: str = ".") -> str:
+    return await _call_word_op("list_available_documents", directory)
+
+
+async def word_get_info(filename: str) -> str:
+    return await _call_word_op("get_document_info", filename)
+
+
+async def word_get_outline(filename: str) -> str:
+    return await _call_word_op("get_document_outline", filename)
+
+
+async def word_get_text(filename: str) -> str:
+    return await _call_word_op("get_document_text", filename)
+
+
+async def word_copy_document(source_filename: str, destination_filename: Optional[str] = None) -> str:
+    return await _call_word_op("copy_document", source_filename, destination_filename)
+
+
+async def word_merge_documents(target_filename: str, source_filenames: List[str], add_page_breaks: bool = True) -> str:
+    return await _call_word_op("merge_documents", target_filename, source_filenames, add_page_breaks)
+
+
+async def word_add_paragraph(filename: str, text: str, style: Optional[str] = None,
+                             font_name: Optional[str] = None, font_size: Optional[int] = None,
+                             bold: Optional[bool] = None, italic: Optional[bool] = None, color: Optional[str] = None) -> str:
+    return await _call_word_op("add_paragraph", filename, text, style, font_name, font_size, bold, italic, color)
+
+
+async def word_add_heading(filename: str, text: str, level: int = 1,
+                           font_name: Optional[str] = None, font_size: Optional[int] = None,
+                           bold: Optional[bool] = None, italic: Optional[bool] = None,
+                           border_bottom: bool = False) -> str:
+    return await _call_word_op("add_heading", filename, text, level, font_name, font_size, bold, italic, border_bottom)
+
+
+async def word_add_table(filename: str, rows: int, cols: int, data: Optional[List[List[str]]] = None) -> str:
+    return await _call_word_op("add_table", filename, rows, cols, data)
+
+
+async def word_search_replace(filename: str, find_text: str, replace_text: str) -> str:
+    return await _call_word_op("search_and_replace", filename, find_text, replace_text)
+
+
+async def word_insert_header_near_text(filename: str, target_text: Optional[str] = None, header_title: str = "",
+                                       position: str = 'after', header_style: str = 'Heading 1',
+                                       target_paragraph_index: Optional[int] = None) -> str:
+    return await _call_word_op("insert_header_near_text_tool", filename, target_text, header_title, position, header_style, target_paragraph_index)
+
+
+async def word_insert_paragraph_near_text(filename: str, target_text: Optional[str] = None, line_text: str = "",
+                                          position: str = 'after', line_style: Optional[str] = None,
+                                          target_paragraph_index: Optional[int] = None) -> str:
+    return await _call_word_op("insert_line_or_paragraph_near_text_tool", filename, target_text, line_text, position, line_style, target_paragraph_index)
+
+
+async def word_insert_list_near_text(filename: str, target_text: Optional[str] = None, list_items: Optional[List[str]] = None,
+                                     position: str = 'after', target_paragraph_index: Optional[int] = None,
+                                     bullet_type: str = 'bullet') -> str:
+    return await _call_word_op("insert_numbered_list_near_text_tool", filename, target_text, list_items, position, target_paragraph_index, bullet_type)
+
+
+async def word_format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int,
+                           bold: Optional[bool] = None, italic: Optional[bool] = None,
+                           underline: Optional[bool] = None, color: Optional[str] = None,
+                           font_size: Optional[int] = None, font_name: Optional[str] = None) -> str:
+    return await _call_word_op("format_text", filename, paragraph_index, start_pos, end_pos, bold, italic, underline, color, font_size, font_name)
+
+
+async def word_create_custom_style(filename: str, style_name: str, bold: Optional[bool] = None,
+                                   italic: Optional[bool] = None, font_size: Optional[int] = None,
+                                   font_name: Optional[str] = None, color: Optional[str] = None,
+                                   base_style: Optional[str] = None) -> str:
+    return await _call_word_op("create_custom_style", filename, style_name, bold, italic, font_size, font_name, color, base_style)
+
+
+async def word_protect_document(filename: str, password: str) -> str:
+    return await _call_word_op("protect_document", filename, password)
+
+
+async def word_unprotect_document(filename: str, password: str) -> str:
+    return await _call_word_op("unprotect_document", filename, password)
+
+
+async def word_add_footnote(filename: str, paragraph_index: int, footnote_text: str) -> str:
+    return await _call_word_op("add_footnote_to_document", filename, paragraph_index, footnote_text)
+
+
+async def word_add_footnote_after_text(filename: str, search_text: str, footnote_text: str,
+                                       output_filename: Optional[str] = None) -> str:
+    return await _call_word_op("add_footnote_after_text", filename, search_text, footnote_text, output_filename)
+
+
+async def word_add_footnote_before_text(filename: str, search_text: str, footnote_text: str,
+                                        output_filename: Optional[str] = None) -> str:
+    return await _call_word_op("add_footnote_before_text", filename, search_text, footnote_text, output_filename)
+
+
+async def word_get_all_comments(filename: str) -> str:
+    return await _call_word_op("get_all_comments", filename)
+
+
+async def word_get_comments_by_author(filename: str, author: str) -> str:
+    return await _call_word_op("get_comments_by_author", filename, author)
+
+
+async def word_get_comments_for_paragraph(filename: str, paragraph_index: int) -> str:
+    return await _call_word_op("get_comments_for_paragraph", filename, paragraph_index)
+
+
+async def word_find_text(filename: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> str:
+    return await _call_word_op("find_text_in_document", filename, text_to_find, match_case, whole_word)
+
+
+async def word_convert_to_pdf(filename: str, output_filename: Optional[str] = None) -> str:
+    return await _call_word_op("convert_to_pdf", filename, output_filename)
+
+
+async def word_convert_to_pdf_batch(filenames: List[str], output_dir: Optional[str] = None) -> str:
+    return await _call_word_op("convert_to_pdf_batch", filenames, output_dir)
+
+
+class _WordBatchOperation(BaseModel):
+    """Base for word_batch operations; unknown keys are rejected up front."""
+    model_config = ConfigDict(extra="forbid")
+
+
+class WordBatchAddParagraph(_WordBatchOperation):
+    op: Literal["add_paragraph"]
+    text: str = Field(description="Paragraph text")
+    style: Optional[str] = Field(default=None, description="Paragraph style name")
+    font_name: Optional[str] = Field(default=None, description="Font name")
+    font_size: Optional[int] = Field(default=None, description="Font size in points")
+    bold: Optional[bool] = Field(default=None, description="Bold text")
+    italic: Optional[bool] = Field(default=None, description="Italic text")
+    color: Optional[str] = Field(default=None, description="Text color as hex RGB, e.g. 'FF0000'")
+
+
+class WordBatchAddHeading(_WordBatchOperation):
+    op: Literal["add_heading"]
+    text: str = Field(description="Heading text")
+    level: int = Field(default=1, ge=0, le=9, description="Heading level (0 = title, 1-9)")
+
+
+class WordBatchAddTable(_WordBatchOperation):
+    op: Literal["add_table"]
+    rows: int = Field(gt=0, description="Number of rows")
+    cols: int = Field(gt=0, description="Number of columns")
+    data: Optional[List[List[str]]] = Field(default=None, description="Cell text, row by row")
+
+
+class WordBatchAddPageBreak(_WordBatchOperation):
+    op: Literal["add_page_break"]
+
+
+class WordBatchSearchReplace(_WordBatchOperation):
+    op: Literal["search_replace"]
+    find_text: str = Field(description="Text to find")
+    replace_text: str = Field(description="Replacement text")
+
+
+WordBatchOperation = Annotated[
+    Union[WordBatchAddParagraph, WordBatchAddHeading, WordBatchAddTable, WordBatchAddPageBreak, WordBatchSearchReplace],
+    Field(discriminator="op"),
+]
+_BATCH_OPS_ADAPTER = TypeAdapter(List[WordBatchOperation])
+
+
+async def word_batch(filename: str, operations: List[WordBatchOperation]) -> str:
+    return await _call_word_op("apply_batch", filename, _BATCH_OPS_ADAPTER.dump_python(operations))
+
+
+# Word manipulation tools: (tool name, description, handler).
+_WORD_TOOL_SPECS = (
+    ("word_create_document", "Create a new Word document with optional metadata.", word_create_document),
+    ("word_list_documents", "List Word documents in a directory.", word_list_documents),
+    ("word_get_info", "Get metadata information from a Word document.", word_get_info),
+    ("word_get_outline", "Get paragraph and table outline of a Word document.", word_get_outline),
+    ("word_get_text", "Extract all text from a Word document.", word_get_text),
+    ("word_copy_document", "Copy a Word document.", word_copy_document),
+    ("word_merge_documents", "Merge multiple Word documents into one.", word_merge_documents),
+    ("word_add_paragraph", "Add a paragraph with optional styling.", word_add_paragraph),
+    ("word_add_heading", "Add a heading to a document.", word_add_heading),
+    ("word_add_table", "Add a table to a document.", word_add_table),
+    ("word_search_replace", "Search and replace text across paragraphs and tables.", word_search_replace),
+    ("word_insert_header_near_text", "Insert a header before/after target text or paragraph index.", word_insert_header_near_text),
+    ("word_insert_paragraph_near_text", "Insert paragraph near target text or index.", word_insert_paragraph_near_text),
+    ("word_insert_list_near_text", "Insert bulleted/numbered list near target text or index.", word_insert_list_near_text),
+    ("word_format_text", "Format a specific range in a paragraph.", word_format_text),
+    ("word_create_custom_style", "Create a custom text style in the document.", word_create_custom_style),
+    ("word_protect_document", "Protect a Word document with password or restrictions.", word_protect_document),
+    ("word_unprotect_document", "Remove password protection from a Word document.", word_unprotect_document),
+    ("word_add_footnote", "Add a footnote to a specific paragraph.", word_add_footnote),
+    ("word_add_footnote_after_text", "Add a footnote after a specific text.", word_add_footnote_after_text),
+    ("word_add_footnote_before_text", "Add a footnote before a specific text.", word_add_footnote_before_text),
+    ("word_add_comment", "Retrieve all comments from the document.", word_get_all_comments),
+    ("word_get_comments_by_author", "Retrieve comments filtered by author.", word_get_comments_by_author),
+    ("word_get_comments_for_paragraph", "Retrieve comments for a paragraph index.", word_get_comments_for_paragraph),
+    ("word_find_text", "Find occurrences of text with options.", word_find_text),
+    ("word_convert_to_pdf", "Convert Word document to PDF.", word_convert_to_pdf),
+    ("word_convert_to_pdf_batch", "Convert multiple Word documents to PDF in one batch.", word_convert_to_pdf_batch),
+    ("word_batch", "Apply multiple edits to a Word document in one open/save cycle. Each operation is selected by its 'op' "
+                   "(add_paragraph, add_heading, add_table, add_page_break, search_replace) and takes that operation's arguments.",
+     word_batch),
+)
+
+
+# Register the advanced Word manipulation tools backed by the word_ops module.
+for _name, _description, _fn in _WORD_TOOL_SPECS:
+    mcp.tool(name=_name, description=_description)(_fn)
+del _name, _description, _fn
 
 @mcp.tool(
     name="create_powerpoint_presentation",
     description="Creates PowerPoint presentations with professional templates using structured slide models.",
-    tags={"powerpoint", "presentation", "slides"},
+    tags=_POWERPOINT_TAGS,
     annotations={"title": "PowerPoint Presentation Creator"}
 )
 async def create_powerpoint_presentation(
@@ -245,21 +567,27 @@ async def create_powerpoint_presentation(
 ) -> str:
     """Creates PowerPoint presentations with structured slide models and professional templates."""
 
-    logger.info(f"Creating PowerPoint presentation with {len(slides)} slides in {format} format")
+    if not slides:
+        return _ERR_POWERPOINT + "No slides provided"
+
+    logger.info("Creating PowerPoint presentation with %d slides in %s format", len(slides), format)
 
     try:
-        slides_data = [slide.model_dump() for slide in slides]
-        result = create_presentation(slides_data, format)
-        logger.info(f"PowerPoint presentation created: {result}")
+        slides_data = _SLIDES_ADAPTER.dump_python(slides)
+        result = await _run_in_process(_create_presentation(), slides_data, format)
+        logger.info("PowerPoint presentation created: %s", result)
         return result
+    except (ValueError, OSError) as e:
+        logger.warning("Error creating PowerPoint presentation: %s", e)
+        return _ERR_POWERPOINT + str(e)
     except Exception as e:
-        logger.error(f"Error creating PowerPoint presentation: {e}")
-        return f"Error creating PowerPoint presentation: {str(e)}"
+        logger.exception("Error creating PowerPoint presentation")
+        return _ERR_POWERPOINT + str(e)
 
 @mcp.tool(
     name="create_email_draft",
     description="Creates an email draft in EML format with HTML content using preset professional styling.",
-    tags={"email", "eml", "communication"},
+    tags=_EMAIL_TAGS,
     annotations={"title": "Email Draft Creator"}
 )
 async def create_email_draft(
@@ -275,10 +603,10 @@ async def create_email_draft(
     Creates professional email drafts in EML format with preset styling and language settings.
     """
 
-    logger.info(f"Creating email draft with subject: {subject}")
+    logger.info("Creating email draft with subject: %s", subject)
 
     try:
-        result = create_eml(
+        result = _create_eml()(
             to=to,
             cc=cc,
             bcc=bcc,
@@ -287,17 +615,35 @@ async def create_email_draft(
             priority=priority,
             language=language
         )
-        logger.info(f"Email draft created: {result}")
+        logger.info("Email draft created: %s", result)
         return result
+    except (ValueError, OSError) as e:
+        logger.warning("Error creating email draft: %s", e)
+        return _ERR_EMAIL + str(e)
     except Exception as e:
-        logger.error(f"Error creating email draft: {e}")
-        return f"Error creating email draft: {str(e)}"
-
-if __name__ == "__main__":
-    mcp.run(
-        transport="streamable-http",
-        host="0.0.0.0",
-        port=8958,
-        log_level=config.logging.mcp_level_str,
-        path="/mcp"
-    )
+        logger.exception("Error creating email draft")
+        return _ERR_EMAIL + str(e)
+
+
+def main() -> None:
+    """Serve the MCP endpoint; started by ``python -m app`` (see ``app/__main__.py``)."""
+    # libuv-based event loop when available (not supported on Windows); asyncio's default otherwise.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    _start_warmup()
+    try:
+        mcp.run(
+            transport="streamable-http",
+            host="0.0.0.0",
+            port=8958,
+            log_level=_LOG_LEVEL,
+            path="/mcp"
+        )
+    finally:
+        _DOCX_POOL.shutdown(wait=True)
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown(wait=True)
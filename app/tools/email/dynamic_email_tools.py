@@ -8,7 +8,9 @@ Updated assumptions:
 """
 from __future__ import annotations
 
+import functools
 import io
+import os
 from email.mime.text import MIMEText
 from email import encoders
 from pathlib import Path
@@ -23,7 +25,11 @@ import logging
 from app.storage import upload_file
 from app.utils.template_utils import find_email_template
 
-__all__ = ["register_email_template_tools_from_yaml"]
+__all__ = [
+    "load_email_templates_yaml",
+    "register_email_template_tools_from_yaml",
+    "register_email_template_tools_from_dict",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -43,14 +49,46 @@ BASE_FIELDS: Dict[str, Any] = {
     "bcc": (Optional[list[str]], Field(None, description="List of BCC recipient email addresses")),
 }
 
+# Fields common to every template, compiled once; each template's model only adds its own args.
+_EmailDraftArgs = create_model("_EmailDraftArgs", **BASE_FIELDS)  # type: ignore
+
+# pystache renderers hold only configuration, so one instance serves every template.
+_RENDERER = pystache.Renderer(file_encoding="utf-8")
+
+
+# libyaml-backed loader; the pure-Python SafeLoader is an order of magnitude slower.
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    _YAML_LOADER = yaml.SafeLoader
+    logger.warning("[dynamic-email] PyYAML was built without libyaml; parsing templates with the slow pure-Python loader")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; the stat-based key makes an edited file miss the cache."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_email_templates_yaml(yaml_path: Path) -> Dict[str, Any]:
+    """Return the parsed templates YAML, reusing the cached result while the file is unchanged."""
+    st = os.stat(yaml_path)
+    return _load_yaml_cached(str(yaml_path), st.st_mtime_ns, st.st_size)
+
 
 def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> None:
     try:
-        cfg = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        cfg = load_email_templates_yaml(yaml_path)
     except Exception as e:  # pragma: no cover
         logger.error(f"[dynamic-email] Failed to load YAML '{yaml_path}': {e}")
         return
 
+    register_email_template_tools_from_dict(mcp, cfg)
+
+
+def register_email_template_tools_from_dict(mcp: FastMCP, cfg: Dict[str, Any]) -> None:
+    """Register one email draft tool per entry of an already parsed templates config."""
     templates = cfg.get("templates") or []
     if not isinstance(templates, list):
         logger.error("[dynamic-email] 'templates' key must be a list – skipping.")
@@ -79,11 +117,11 @@ def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> No
             logger.info(f"[dynamic-email] Using template for {name}: {resolved}")
             html_source = Path(resolved).read_text(encoding="utf-8")
 
-            fields: Dict[str, Any] = dict(BASE_FIELDS)
+            fields: Dict[str, Any] = {}
 
             for arg in spec.get("args", []):
                 arg_name = arg.get("name")
-                if not arg_name or arg_name in fields:
+                if not arg_name or arg_name in fields or arg_name in BASE_FIELDS:
                     continue
 
                 enum_values = arg.get("enum")
@@ -111,12 +149,10 @@ def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> No
                 desc = arg.get("description")
                 fields[arg_name] = (field_type, Field(default, description=desc) if desc is not None else default)
 
-            model = create_model(f"{name}_Args", **fields)  # type: ignore
+            model = create_model(f"{name}_Args", __base__=_EmailDraftArgs, **fields)  # type: ignore
             globals()[model.__name__] = model
 
-            renderer = pystache.Renderer(file_encoding="utf-8")
-
-            def make_tool_fn(_model=model, _html=html_source, _renderer=renderer, _name=name):
+            def make_tool_fn(_model=model, _html=html_source, _renderer=_RENDERER, _name=name, _log_error=logger.error):
                 def tool_impl(data):
                     payload = data.model_dump()
                     safe_payload = {k: ("" if v is None else v) for k, v in payload.items()}
@@ -129,7 +165,7 @@ def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> No
                     try:
                         html_rendered = _renderer.render(_html, safe_payload)
                     except Exception as e:  # pragma: no cover
-                        logger.error(f"[dynamic-email] Error rendering template {_name}: {e}")
+                        _log_error("[dynamic-email] Error rendering template %s: %s", _name, e)
                         return f"Error rendering template {_name}: {e}"
 
                     # Mirror static create_eml: single HTML body base64 encoded.
@@ -154,7 +190,7 @@ def register_email_template_tools_from_yaml(mcp: FastMCP, yaml_path: Path) -> No
                         buffer.seek(0)
                         return upload_file(buffer, "eml")
                     except Exception as e:  # pragma: no cover
-                        logger.error(f"[dynamic-email] Error creating email draft for template '{_name}': {e}")
+                        _log_error("[dynamic-email] Error creating email draft for template '%s': %s", _name, e)
                         return f"Error creating email draft for template '{_name}': {e}"
                     finally:
                         buffer.close()
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Dict, Any
+from typing import Iterable, Dict, Any
 
 from app.storage import upload_file
 from .helpers import PowerpointPresentation
@@ -7,10 +7,10 @@ from .helpers import PowerpointPresentation
 logger = logging.getLogger(__name__)
 
 
-def create_presentation(slides: List[Dict[str, Any]], format: str = "4:3") -> str:
+def create_presentation(slides: Iterable[Dict[str, Any]], format: str = "4:3") -> str:
     """Create a PowerPoint presentation from structured slides and upload it.
 
-    :param slides: List of slide dicts with keys based on slide_type
+    :param slides: Slide dicts with keys based on slide_type
     :param format: "4:3" or "16:9"
     :return: Upload status or URL text
     :raises: Exception on failure (propagated to caller)
@@ -1,6 +1,15 @@
 """Word tools package."""
 
-from .creation import markdown_to_word
-from . import manipulation
+import importlib
 
 __all__ = ["markdown_to_word", "manipulation"]
+
+
+def __getattr__(name):
+    # Resolve the public names lazily so importing only the creation or only the
+    # manipulation half of the package does not load the other one.
+    if name == "markdown_to_word":
+        return importlib.import_module(".creation", __name__).markdown_to_word
+    if name == "manipulation":
+        return importlib.import_module(".manipulation", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,15 @@ from . import protection_tools
 from . import footnote_tools
 from . import comment_tools
 from . import extended_document_tools
+from . import batch_tools
+from .document_tools import merge_documents
+from .extended_document_tools import (
+    get_paragraph_text_from_document,
+    find_text_in_document,
+    convert_to_pdf,
+    convert_to_pdf_batch,
+)
+from .batch_tools import apply_batch
 
 __all__ = [
     "document_tools",
@@ -16,4 +25,11 @@ __all__ = [
     "footnote_tools",
     "comment_tools",
     "extended_document_tools",
+    "batch_tools",
+    "merge_documents",
+    "get_paragraph_text_from_document",
+    "find_text_in_document",
+    "convert_to_pdf",
+    "convert_to_pdf_batch",
+    "apply_batch",
 ]
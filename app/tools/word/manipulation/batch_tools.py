@@ -0,0 +1,123 @@
+"""
+Batch editing tools for Word Document Server.
+
+These tools apply several edits to a document in a single open/save cycle, so a
+sequence of small changes does not re-parse and re-serialize the .docx each time.
+"""
+import os
+from typing import Any, Callable, Dict, List
+
+from docx import Document
+from docx.shared import Pt, RGBColor
+
+from app.tools.word.utils import check_file_writeable, ensure_docx_extension, find_and_replace_text, mark_document_dirty
+from app.tools.word.core import ensure_heading_style, ensure_table_style
+
+
+def _add_paragraph(doc, text: str, style: str = None, font_name: str = None, font_size: int = None,
+                   bold: bool = None, italic: bool = None, color: str = None) -> str:
+    paragraph = doc.add_paragraph(text)
+    result = "Paragraph added"
+    if style:
+        try:
+            paragraph.style = style
+        except KeyError:
+            result = f"Style '{style}' not found, paragraph added with default style"
+    for run in paragraph.runs:
+        if font_name:
+            run.font.name = font_name
+        if font_size:
+            run.font.size = Pt(font_size)
+        if bold is not None:
+            run.font.bold = bold
+        if italic is not None:
+            run.font.italic = italic
+        if color:
+            run.font.color.rgb = RGBColor.from_string(color.lstrip('#'))
+    return result
+
+
+def _add_heading(doc, text: str, level: int = 1) -> str:
+    ensure_heading_style(doc)
+    doc.add_heading(text, level=level)
+    return f"Heading added (level {level})"
+
+
+def _add_table(doc, rows: int, cols: int, data: List[List[str]] = None) -> str:
+    table = doc.add_table(rows=rows, cols=cols)
+    ensure_table_style(doc)
+    try:
+        table.style = 'Table Grid'
+    except KeyError:
+        pass
+    if data:
+        for i, row_data in enumerate(data[:rows]):
+            for j, cell_text in enumerate(row_data[:cols]):
+                table.cell(i, j).text = str(cell_text)
+    return f"Table added ({rows}x{cols})"
+
+
+def _add_page_break(doc) -> str:
+    doc.add_page_break()
+    return "Page break added"
+
+
+def _search_replace(doc, find_text: str, replace_text: str) -> str:
+    count = find_and_replace_text(doc, find_text, replace_text)
+    return f"Replaced {count} occurrence(s) of '{find_text}'"
+
+
+# Operation name -> function applied to the already opened Document.
+BATCH_OPERATIONS: Dict[str, Callable[..., str]] = {
+    "add_paragraph": _add_paragraph,
+    "add_heading": _add_heading,
+    "add_table": _add_table,
+    "add_page_break": _add_page_break,
+    "search_replace": _search_replace,
+}
+
+
+async def apply_batch(filename: str, operations: List[Dict[str, Any]]) -> str:
+    """Apply multiple edits to a Word document, opening and saving it only once.
+
+    Args:
+        filename: Path to the Word document
+        operations: List of operations, each a dict with an ``op`` key naming one of
+                    BATCH_OPERATIONS and the remaining keys as its arguments, e.g.
+                    ``{"op": "add_heading", "text": "Summary", "level": 2}``
+    """
+    filename = ensure_docx_extension(filename)
+
+    if not os.path.exists(filename):
+        return f"Document {filename} does not exist"
+
+    is_writeable, error_message = check_file_writeable(filename)
+    if not is_writeable:
+        return f"Cannot modify document: {error_message}. Consider creating a copy first."
+
+    if not operations:
+        return "No operations provided"
+
+    # Validate the whole batch up front so a bad entry does not leave a half-applied document
+    for index, operation in enumerate(operations):
+        op_name = operation.get("op") if isinstance(operation, dict) else None
+        if op_name not in BATCH_OPERATIONS:
+            return (
+                f"Invalid operation at index {index}: {op_name!r}. "
+                f"Supported operations: {', '.join(BATCH_OPERATIONS)}"
+            )
+
+    try:
+        doc = Document(filename)
+        results = []
+        for index, operation in enumerate(operations):
+            args = {key: value for key, value in operation.items() if key != "op"}
+            try:
+                results.append(f"{index}: {BATCH_OPERATIONS[operation['op']](doc, **args)}")
+            except Exception as e:
+                return f"Failed to apply operation {index} ({operation['op']}): {str(e)}. Document was not saved."
+        doc.save(filename)
+        mark_document_dirty(filename)
+        return f"Applied {len(operations)} operation(s) to {filename}\n" + "\n".join(results)
+    except Exception as e:
+        return f"Failed to apply batch: {str(e)}"
@@ -5,11 +5,9 @@ These tools provide high-level interfaces for extracting and analyzing
 comments from Word documents through the MCP protocol.
 """
 import os
-import json
 from typing import Dict, List, Optional, Any
-from docx import Document
 
-from app.tools.word.utils import ensure_docx_extension
+from app.tools.word.utils import ensure_docx_extension, get_readonly_doc, to_json
 from app.tools.word.core.comments import (
     extract_all_comments,
     filter_comments_by_author,
@@ -30,30 +28,30 @@ async def get_all_comments(filename: str) -> str:
     filename = ensure_docx_extension(filename)
     
     if not os.path.exists(filename):
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Document {filename} does not exist'
-        }, indent=2)
+        })
     
     try:
         # Load the document
-        doc = Document(filename)
+        doc = get_readonly_doc(filename)
         
         # Extract all comments
         comments = extract_all_comments(doc)
         
         # Return results
-        return json.dumps({
+        return to_json({
             'success': True,
             'comments': comments,
             'total_comments': len(comments)
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Failed to extract comments: {str(e)}'
-        }, indent=2)
+        })
 
 
 async def get_comments_by_author(filename: str, author: str) -> str:
@@ -70,20 +68,20 @@ async def get_comments_by_author(filename: str, author: str) -> str:
     filename = ensure_docx_extension(filename)
     
     if not os.path.exists(filename):
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Document {filename} does not exist'
-        }, indent=2)
+        })
     
     if not author or not author.strip():
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': 'Author name cannot be empty'
-        }, indent=2)
+        })
     
     try:
         # Load the document
-        doc = Document(filename)
+        doc = get_readonly_doc(filename)
         
         # Extract all comments
         all_comments = extract_all_comments(doc)
@@ -92,18 +90,18 @@ async def get_comments_by_author(filename: str, author: str) -> str:
         author_comments = filter_comments_by_author(all_comments, author)
         
         # Return results
-        return json.dumps({
+        return to_json({
             'success': True,
             'author': author,
             'comments': author_comments,
             'total_comments': len(author_comments)
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Failed to extract comments: {str(e)}'
-        }, indent=2)
+        })
 
 
 async def get_comments_for_paragraph(filename: str, paragraph_index: int) -> str:
@@ -120,27 +118,27 @@ async def get_comments_for_paragraph(filename: str, paragraph_index: int) -> str
     filename = ensure_docx_extension(filename)
     
     if not os.path.exists(filename):
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Document {filename} does not exist'
-        }, indent=2)
+        })
     
     if paragraph_index < 0:
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': 'Paragraph index must be non-negative'
-        }, indent=2)
+        })
     
     try:
         # Load the document
-        doc = Document(filename)
+        doc = get_readonly_doc(filename)
         
         # Check if paragraph index is valid
         if paragraph_index >= len(doc.paragraphs):
-            return json.dumps({
+            return to_json({
                 'success': False,
                 'error': f'Paragraph index {paragraph_index} is out of range. Document has {len(doc.paragraphs)} paragraphs.'
-            }, indent=2)
+            })
         
         # Extract all comments
         all_comments = extract_all_comments(doc)
@@ -152,16 +150,16 @@ async def get_comments_for_paragraph(filename: str, paragraph_index: int) -> str
         paragraph_text = doc.paragraphs[paragraph_index].text
         
         # Return results
-        return json.dumps({
+        return to_json({
             'success': True,
             'paragraph_index': paragraph_index,
             'paragraph_text': paragraph_text,
             'comments': para_comments,
             'total_comments': len(para_comments)
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return to_json({
             'success': False,
             'error': f'Failed to extract comments: {str(e)}'
-        }, indent=2)
+        })
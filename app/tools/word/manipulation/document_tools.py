@@ -1,9 +1,15 @@
 """Document tools for Word."""
 
+import hashlib
 import os
 import json
-from typing import Dict, List, Optional
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import Part
+from docx.oxml.ns import qn
 
 from app.tools.word.utils import (
     check_file_writeable,
@@ -15,5 +21,159 @@ from app.tools.word.utils import (
     get_document_xml,
     insert_header_near_text,
     insert_line_or_paragraph_near_text,
+    mark_document_dirty,
 )
 from app.tools.word.core import ensure_heading_style, ensure_table_style, copy_table
+
+_SECT_PR = qn("w:sectPr")
+
+# Attributes that hold a relationship id of the containing part.
+_REL_ATTRS = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+# Markup pointing into parts that merge_documents does not carry over (footnotes,
+# endnotes, comments, numbering); left in place it would dangle in the target.
+_UNMERGED_REFS = (
+    qn("w:footnoteReference"),
+    qn("w:endnoteReference"),
+    qn("w:commentReference"),
+    qn("w:commentRangeStart"),
+    qn("w:commentRangeEnd"),
+    qn("w:numPr"),
+)
+
+# Outermost wrappers removed together with a relationship that cannot be remapped.
+_OBJECT_CONTAINERS = (
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent",
+    qn("w:drawing"),
+    qn("w:pict"),
+    qn("w:object"),
+)
+
+
+def _copy_image_part(source_image, target_part, image_parts: Dict[Tuple[str, str], Part]) -> Part:
+    """Copy an image part byte for byte into the target package.
+
+    The blob is not parsed, so formats python-docx cannot read (EMF, WMF, SVG)
+    survive the merge. Identical images across sources share one part.
+    """
+    key = (source_image.content_type, hashlib.sha1(source_image.blob).hexdigest())
+    image_part = image_parts.get(key)
+    if image_part is None:
+        package = target_part.package
+        partname = package.next_partname(f"/word/media/image%d.{source_image.partname.ext}")
+        image_part = Part(partname, source_image.content_type, source_image.blob, package)
+        image_parts[key] = image_part
+    return image_part
+
+
+def _remap_relationship(rid: str, source_part, target_part, image_parts: Dict[Tuple[str, str], Part]) -> Optional[str]:
+    """Recreate a source relationship on the target part and return its new id.
+
+    Images are copied into the target package and external targets (hyperlinks,
+    linked images) are related again; anything else returns None.
+    """
+    rel = source_part.rels.get(rid)
+    if rel is None:
+        return None
+    if rel.is_external:
+        return target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+    if rel.reltype == RT.IMAGE:
+        return target_part.relate_to(_copy_image_part(rel.target_part, target_part, image_parts), RT.IMAGE)
+    return None
+
+
+def _import_body_element(element, source_part, target_part, image_parts: Dict[Tuple[str, str], Part]):
+    """Deep-copy a body element from a source document so it is valid in the target.
+
+    Relationship ids are remapped onto the target part; pictures, objects and
+    references whose targets cannot be carried over are dropped. ``image_parts``
+    collects the copied images for the whole merge.
+    """
+    copied = deepcopy(element)
+
+    for ref in list(copied.iter(*_UNMERGED_REFS)):
+        ref.getparent().remove(ref)
+
+    to_remove = []
+    for el in copied.iter():
+        for attr in _REL_ATTRS:
+            rid = el.get(attr)
+            if rid is None:
+                continue
+            new_rid = _remap_relationship(rid, source_part, target_part, image_parts)
+            if new_rid is not None:
+                el.set(attr, new_rid)
+                continue
+            container = el
+            for ancestor in el.iterancestors():
+                if ancestor.tag in _OBJECT_CONTAINERS:
+                    container = ancestor
+                if ancestor is copied:
+                    break
+            to_remove.append(container)
+    for el in to_remove:
+        parent = el.getparent()
+        if parent is not None and el is not copied:
+            parent.remove(el)
+
+    # Drawing ids must be unique within the target document
+    doc_prs = list(copied.iter(qn("wp:docPr")))
+    if doc_prs:
+        next_id = target_part.next_id
+        for doc_pr in doc_prs:
+            doc_pr.set("id", str(next_id))
+            next_id += 1
+    return copied
+
+
+async def merge_documents(target_filename: str, source_filenames: List[str], add_page_breaks: bool = True) -> str:
+    """Merge multiple Word documents into a single document.
+
+    Args:
+        target_filename: Path to the target document
+        source_filenames: List of paths to source documents to merge
+        add_page_breaks: If True, add page breaks between documents
+    """
+    target_filename = ensure_docx_extension(target_filename)
+
+    if os.path.exists(target_filename):
+        is_writeable, error_message = check_file_writeable(target_filename)
+        if not is_writeable:
+            return f"Cannot create target document: {error_message}"
+
+    if not source_filenames:
+        return "Cannot merge documents: no source files provided"
+
+    source_paths = [ensure_docx_extension(filename) for filename in source_filenames]
+    missing_files = [path for path in source_paths if not os.path.exists(path)]
+    if missing_files:
+        return f"Cannot merge documents. The following source files do not exist: {', '.join(missing_files)}"
+
+    try:
+        # Parse all sources concurrently (lxml does the heavy lifting), then assemble in order
+        with ThreadPoolExecutor(max_workers=min(8, len(source_paths))) as executor:
+            source_docs = list(executor.map(Document, source_paths))
+
+        target_doc = Document()
+        target_body = target_doc.element.body
+        sect_pr = target_body.sectPr
+        image_parts: Dict[Tuple[str, str], Part] = {}
+        for i, source_doc in enumerate(source_docs):
+            if add_page_breaks and i > 0:
+                target_doc.add_page_break()
+            # Copy paragraphs and tables in document order; each source's section
+            # properties are dropped so the target keeps a single trailing sectPr
+            for child in source_doc.element.body.iterchildren():
+                if child.tag == _SECT_PR:
+                    continue
+                imported = _import_body_element(child, source_doc.part, target_doc.part, image_parts)
+                if sect_pr is not None:
+                    sect_pr.addprevious(imported)
+                else:
+                    target_body.append(imported)
+
+        target_doc.save(target_filename)
+        mark_document_dirty(target_filename)
+        return f"Successfully merged {len(source_paths)} documents into {target_filename}"
+    except Exception as e:
+        return f"Failed to merge documents: {str(e) or type(e).__name__}"
@@ -4,14 +4,19 @@ Extended document tools for Word Document Server.
 These tools provide enhanced document content extraction and search capabilities.
 """
 import os
-import json
 import subprocess
 import platform
 import shutil
+import threading
 from typing import Dict, List, Optional, Any, Union, Tuple
 from docx import Document
 
-from app.tools.word.utils import check_file_writeable, ensure_docx_extension, get_paragraph_text, find_text
+from app.tools.word.utils import check_file_writeable, ensure_docx_extension, get_paragraph_text, find_text, to_json
+
+# Headless LibreOffice instances sharing the default user profile collide: a second
+# one hands its job to the running instance or exits without writing the PDF. The
+# PDF tools run on threads of the server process, so one lock serializes them.
+_LIBREOFFICE_LOCK = threading.Lock()
 
 
 async def get_paragraph_text_from_document(filename: str, paragraph_index: int) -> str:
@@ -32,7 +37,7 @@ async def get_paragraph_text_from_document(filename: str, paragraph_index: int)
     
     try:
         result = get_paragraph_text(filename, paragraph_index)
-        return json.dumps(result, indent=2)
+        return to_json(result)
     except Exception as e:
         return f"Failed to get paragraph text: {str(e)}"
 
@@ -57,7 +62,7 @@ async def find_text_in_document(filename: str, text_to_find: str, match_case: bo
     try:
         
         result = find_text(filename, text_to_find, match_case, whole_word)
-        return json.dumps(result, indent=2)
+        return to_json(result)
     except Exception as e:
         return f"Failed to search for text: {str(e)}"
 
@@ -128,7 +133,8 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
                     os.makedirs(output_dir_for_lo, exist_ok=True)
                     
                     cmd = [cmd_name, '--headless', '--convert-to', 'pdf', '--outdir', output_dir_for_lo, filename]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, check=False)
+                    with _LIBREOFFICE_LOCK:
+                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, check=False)
 
                     if result.returncode == 0:
                         # LibreOffice typically creates a PDF with the same base name as the source file.
@@ -181,3 +187,91 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
             
     except Exception as e:
         return f"Failed to convert document to PDF: {str(e)}"
+
+
+def _libreoffice_command() -> Optional[str]:
+    """Return the first LibreOffice executable available on this platform, if any."""
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        lo_commands = ["soffice", "/Applications/LibreOffice.app/Contents/MacOS/soffice"]
+    elif system == "Linux":
+        lo_commands = ["libreoffice", "soffice"]
+    else:
+        return None
+    for cmd_name in lo_commands:
+        if shutil.which(cmd_name) or os.path.isfile(cmd_name):
+            return cmd_name
+    return None
+
+
+async def convert_to_pdf_batch(filenames: List[str], output_dir: Optional[str] = None) -> str:
+    """Convert several Word documents to PDF with as few LibreOffice runs as possible.
+
+    Starting LibreOffice dominates the cost of a single conversion, so all documents
+    sharing an output directory are passed to one ``--convert-to pdf`` invocation.
+    Falls back to convert_to_pdf per document when LibreOffice is not available.
+
+    Args:
+        filenames: Paths to the Word documents
+        output_dir: Optional directory for the PDFs. If not provided, each PDF is
+                    written next to its source document
+    """
+    if not filenames:
+        return "No documents provided for conversion"
+
+    filenames = [ensure_docx_extension(filename) for filename in filenames]
+    missing_files = [filename for filename in filenames if not os.path.exists(filename)]
+    if missing_files:
+        return f"Cannot convert documents. The following documents do not exist: {', '.join(missing_files)}"
+
+    cmd_name = _libreoffice_command()
+    if cmd_name is None:
+        results = []
+        for filename in filenames:
+            output_filename = None
+            if output_dir:
+                base_name = os.path.splitext(os.path.basename(filename))[0]
+                output_filename = os.path.join(output_dir, f"{base_name}.pdf")
+            results.append(f"{filename}: {await convert_to_pdf(filename, output_filename)}")
+        return "\n".join(results)
+
+    # Group documents (by input index) into runs per output directory. LibreOffice names
+    # each PDF after its source, so documents with the same base name must go to separate runs.
+    base_names = [os.path.splitext(os.path.basename(filename))[0] for filename in filenames]
+    batches: List[Tuple[str, List[int]]] = []
+    for index, filename in enumerate(filenames):
+        target_dir = os.path.abspath(output_dir or os.path.dirname(filename) or '.')
+        for batch_dir, batch in batches:
+            if batch_dir == target_dir and all(base_names[other] != base_names[index] for other in batch):
+                batch.append(index)
+                break
+        else:
+            batches.append((target_dir, [index]))
+
+    # Batches complete out of input order; store each result at its input index.
+    results: List[Optional[str]] = [None] * len(filenames)
+    for target_dir, batch in batches:
+        os.makedirs(target_dir, exist_ok=True)
+        if not os.access(target_dir, os.W_OK):
+            for index in batch:
+                results[index] = f"Cannot create PDF: Directory {target_dir} is not writeable"
+            continue
+
+        pdf_paths = [os.path.join(target_dir, f"{base_names[index]}.pdf") for index in batch]
+        previous_mtimes = [os.path.getmtime(path) if os.path.exists(path) else None for path in pdf_paths]
+
+        cmd = [cmd_name, '--headless', '--convert-to', 'pdf', '--outdir', target_dir, *(filenames[index] for index in batch)]
+        try:
+            with _LIBREOFFICE_LOCK:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60 * len(batch), check=False)
+            stderr = result.stderr.strip()
+        except (subprocess.SubprocessError, OSError) as e:
+            stderr = str(e)
+
+        for index, pdf_path, previous_mtime in zip(batch, pdf_paths, previous_mtimes):
+            if os.path.exists(pdf_path) and os.path.getmtime(pdf_path) != previous_mtime:
+                results[index] = f"Document successfully converted to PDF via {cmd_name}: {pdf_path}"
+            else:
+                results[index] = f"Failed to convert to PDF via {cmd_name}. Stderr: {stderr}"
+
+    return "\n".join(f"{filename}: {line}" for filename, line in zip(filenames, results))
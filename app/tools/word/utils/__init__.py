@@ -13,7 +13,10 @@ from .document_utils import (
     insert_line_or_paragraph_near_text,
     replace_paragraph_block_below_header,
     replace_block_between_manual_anchors,
+    get_readonly_doc,
+    mark_document_dirty,
 )
 from .extended_document_utils import get_paragraph_text, find_text
+from .json_utils import to_json
 
 __all__ = [name for name in globals().keys() if not name.startswith("_")]
@@ -2,13 +2,61 @@
 Document utility functions for Word Document Server.
 """
 import json
-from typing import Dict, List, Any
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
 from docx import Document
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+from app.config import get_config
+
+
+# Parsed documents for the read-only helpers: abspath -> ((mtime_ns, size), Document),
+# least recently used first. Every worker process holds its own copy, so the size
+# (MCP_DOCX_CACHE_SIZE) is kept small; 0 disables caching.
+_DOC_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_DOC_CACHE_SIZE = get_config().server.docx_cache_size
+_DOC_CACHE_LOCK = threading.Lock()
+
+
+def get_readonly_doc(doc_path: str):
+    """Return the parsed document, reusing a cached parse while the file is unchanged.
+
+    The Document is shared between callers: only read from it, never modify or save it.
+    """
+    path = os.path.abspath(doc_path)
+    if _DOC_CACHE_SIZE <= 0:
+        return Document(path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _DOC_CACHE_LOCK:
+        entry = _DOC_CACHE.get(path)
+        if entry is not None and entry[0] == key:
+            _DOC_CACHE.move_to_end(path)
+            return entry[1]
+
+    doc = Document(path)
+    with _DOC_CACHE_LOCK:
+        _DOC_CACHE[path] = (key, doc)
+        _DOC_CACHE.move_to_end(path)
+        while len(_DOC_CACHE) > _DOC_CACHE_SIZE:
+            _DOC_CACHE.popitem(last=False)
+    return doc
+
+
+def mark_document_dirty(doc_path: str) -> None:
+    """Drop the cached parse of a document after this process has written it.
+
+    Catches writes that leave mtime and size unchanged; other processes' writes
+    are detected through the (mtime_ns, size) check.
+    """
+    with _DOC_CACHE_LOCK:
+        _DOC_CACHE.pop(os.path.abspath(doc_path), None)
+
 
 def get_document_properties(doc_path: str) -> Dict[str, Any]:
     """Get properties of a Word document."""
@@ -17,7 +65,7 @@ def get_document_properties(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
     
     try:
-        doc = Document(doc_path)
+        doc = get_readonly_doc(doc_path)
         core_props = doc.core_properties
         
         return {
@@ -45,7 +93,7 @@ def extract_document_text(doc_path: str) -> str:
         return f"Document {doc_path} does not exist"
     
     try:
-        doc = Document(doc_path)
+        doc = get_readonly_doc(doc_path)
         text = []
         
         for paragraph in doc.paragraphs:
@@ -69,7 +117,7 @@ def get_document_structure(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
     
     try:
-        doc = Document(doc_path)
+        doc = get_readonly_doc(doc_path)
         structure = {
             "paragraphs": [],
             "tables": []
@@ -232,6 +280,7 @@ def insert_header_near_text(doc_path: str, target_text: str = None, header_title
         else:
             para._element.addnext(new_para._element)
         doc.save(doc_path)
+        mark_document_dirty(doc_path)
         if anchor_index is not None:
             return f"Header '{header_title}' (style: {header_style}) inserted {position} paragraph (index {anchor_index})."
         else:
@@ -287,6 +336,7 @@ def insert_line_or_paragraph_near_text(doc_path: str, target_text: str = None, l
         else:
             para._element.addnext(new_para._element)
         doc.save(doc_path)
+        mark_document_dirty(doc_path)
         if anchor_index is not None:
             return f"Line/paragraph inserted {position} paragraph (index {anchor_index}) with style '{style}'."
         else:
@@ -408,6 +458,7 @@ def insert_numbered_list_near_text(doc_path: str, target_text: str = None, list_
             else:
                 para._element.addnext(p._element)
         doc.save(doc_path)
+        mark_document_dirty(doc_path)
         list_type = "bulleted" if bullet_type == 'bullet' else "numbered"
         if anchor_index is not None:
             return f"{list_type.capitalize()} list with {len(new_paras)} items inserted {position} paragraph (index {anchor_index})."
@@ -525,6 +576,7 @@ def replace_paragraph_block_below_header(
         current_para = new_para
     
     doc.save(doc_path)
+    mark_document_dirty(doc_path)
     return f"Replaced content under '{header_text}' with {len(new_paragraphs)} paragraph(s), style: {style_to_use}, removed {removed_count} elements."
 
 
@@ -598,6 +650,7 @@ def replace_block_between_manual_anchors(
     for el in to_remove:
         body.remove(el)
     doc.save(doc_path)
+    mark_document_dirty(doc_path)
     # Reload and find start anchor for insertion
     doc = Document(doc_path)
     paras = doc.paragraphs
@@ -615,4 +668,5 @@ def replace_block_between_manual_anchors(
         anchor_para._element.addnext(new_para._element)
         anchor_para = new_para
     doc.save(doc_path)
+    mark_document_dirty(doc_path)
     return f"Replaced content between '{start_anchor_text}' and '{end_anchor_text or 'next logical header'}' with {len(new_paragraphs)} paragraph(s), style: {style_to_use}, removed {len(to_remove)} elements."
@@ -1,8 +1,11 @@
 """
 Extended document utilities for Word Document Server.
 """
+import functools
+import re
 from typing import Dict, List, Any, Tuple
-from docx import Document
+
+from .document_utils import get_readonly_doc
 
 
 def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
@@ -21,7 +24,7 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
     
     try:
-        doc = Document(doc_path)
+        doc = get_readonly_doc(doc_path)
         
         # Check if paragraph index is valid
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
@@ -39,6 +42,25 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Failed to get paragraph text: {str(e)}"}
 
 
+@functools.lru_cache(maxsize=64)
+def _search_pattern(text_to_find: str, match_case: bool, whole_word: bool) -> "re.Pattern[str]":
+    """Compile (once per query) the pattern used by find_text.
+
+    Whole-word matches must be delimited by whitespace or the paragraph edges,
+    the same notion of a "word" as ``str.split()``.
+    """
+    pattern = re.escape(text_to_find)
+    if whole_word:
+        pattern = rf"(?<!\S){pattern}(?!\S)"
+    return re.compile(pattern, 0 if match_case else re.IGNORECASE)
+
+
+def _match_positions(pattern: "re.Pattern[str]", text: str, whole_word: bool):
+    """Yield the position of each match: word index for whole-word search, else character offset."""
+    for match in pattern.finditer(text):
+        yield len(text[:match.start()].split()) if whole_word else match.start()
+
+
 def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> Dict[str, Any]:
     """
     Find all occurrences of specific text in a Word document.
@@ -60,7 +82,8 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
         return {"error": "Search text cannot be empty"}
     
     try:
-        doc = Document(doc_path)
+        doc = get_readonly_doc(doc_path)
+        pattern = _search_pattern(text_to_find, match_case, whole_word)
         results = {
             "query": text_to_find,
             "match_case": match_case,
@@ -71,94 +94,28 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
         
         # Search in paragraphs
         for i, para in enumerate(doc.paragraphs):
-            # Prepare text for comparison
             para_text = para.text
-            search_text = text_to_find
-            
-            if not match_case:
-                para_text = para_text.lower()
-                search_text = search_text.lower()
-            
-            # Find all occurrences (simple implementation)
-            start_pos = 0
-            while True:
-                if whole_word:
-                    # For whole word search, we need to check word boundaries
-                    words = para_text.split()
-                    found = False
-                    for word_idx, word in enumerate(words):
-                        if (word == search_text or 
-                            (not match_case and word.lower() == search_text.lower())):
-                            results["occurrences"].append({
-                                "paragraph_index": i,
-                                "position": word_idx,
-                                "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                            })
-                            results["total_count"] += 1
-                            found = True
-                    
-                    # Break after checking all words
-                    break
-                else:
-                    # For substring search
-                    pos = para_text.find(search_text, start_pos)
-                    if pos == -1:
-                        break
-                    
-                    results["occurrences"].append({
-                        "paragraph_index": i,
-                        "position": pos,
-                        "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                    })
-                    results["total_count"] += 1
-                    start_pos = pos + len(search_text)
+            for pos in _match_positions(pattern, para_text, whole_word):
+                results["occurrences"].append({
+                    "paragraph_index": i,
+                    "position": pos,
+                    "context": para_text[:100] + ("..." if len(para_text) > 100 else "")
+                })
+                results["total_count"] += 1
         
         # Search in tables
         for table_idx, table in enumerate(doc.tables):
             for row_idx, row in enumerate(table.rows):
                 for col_idx, cell in enumerate(row.cells):
-                    for para_idx, para in enumerate(cell.paragraphs):
-                        # Prepare text for comparison
+                    for para in cell.paragraphs:
                         para_text = para.text
-                        search_text = text_to_find
-                        
-                        if not match_case:
-                            para_text = para_text.lower()
-                            search_text = search_text.lower()
-                        
-                        # Find all occurrences (simple implementation)
-                        start_pos = 0
-                        while True:
-                            if whole_word:
-                                # For whole word search, check word boundaries
-                                words = para_text.split()
-                                found = False
-                                for word_idx, word in enumerate(words):
-                                    if (word == search_text or 
-                                        (not match_case and word.lower() == search_text.lower())):
-                                        results["occurrences"].append({
-                                            "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                            "position": word_idx,
-                                            "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                                        })
-                                        results["total_count"] += 1
-                                        found = True
-                                
-                                # Break after checking all words
-                                break
-                            else:
-                                # For substring search
-                                pos = para_text.find(search_text, start_pos)
-                                if pos == -1:
-                                    break
-                                
-                                results["occurrences"].append({
-                                    "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                    "position": pos,
-                                    "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                                })
-                                results["total_count"] += 1
-                                start_pos = pos + len(search_text)
+                        for pos in _match_positions(pattern, para_text, whole_word):
+                            results["occurrences"].append({
+                                "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
+                                "position": pos,
+                                "context": para_text[:100] + ("..." if len(para_text) > 100 else "")
+                            })
+                            results["total_count"] += 1
         
         return results
     except Exception as e:
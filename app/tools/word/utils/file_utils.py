@@ -1,6 +1,7 @@
 """
 File utility functions for Word Document Server.
 """
+import functools
 import os
 from typing import Tuple, Optional
 import shutil
@@ -70,6 +71,7 @@ def create_document_copy(source_path: str, dest_path: Optional[str] = None) -> T
         return False, f"Failed to copy document: {str(e)}", None
 
 
+@functools.lru_cache(maxsize=256)
 def ensure_docx_extension(filename: str) -> str:
     """
     Ensure filename has .docx extension.
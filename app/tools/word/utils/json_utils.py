@@ -0,0 +1,28 @@
+"""
+JSON serialization helpers for Word Document Server tool responses.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+def to_json(data: Any) -> str:
+    """
+    Serialize a tool response as indented JSON.
+
+    Uses orjson when it is installed (several times faster for large outlines and
+    comment lists) and falls back to the standard library otherwise.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
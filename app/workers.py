@@ -0,0 +1,31 @@
+"""Functions executed inside the converter process pool.
+
+Workers are started through forkserver/spawn rather than forked from the
+threaded server. Those start methods re-import the launching module in each
+worker, which is why the server is started from the thin ``app/__main__.py``
+and not from ``app.main``: workers only import this module and the office
+backends, never the FastMCP app. Anything submitted to the pool therefore has
+to live in an importable module like this one, which only pulls in the Word
+manipulation backend when needed.
+"""
+import asyncio
+import threading
+
+# Per-thread event loop for running word_ops coroutines inside pool workers.
+_WORKER_LOCAL = threading.local()
+
+
+def run_word_op(op_name: str, *args):
+    """Run ``word_ops.<op_name>`` to completion in a worker thread or process.
+
+    The word_ops entry points are declared ``async`` but do blocking python-docx
+    work, so they run on a private event loop off the server's loop. The loop is
+    kept per worker thread and reused across calls rather than built and torn down
+    by ``asyncio.run`` for every operation.
+    """
+    from app.tools.word import manipulation
+
+    loop = getattr(_WORKER_LOCAL, "loop", None)
+    if loop is None:
+        loop = _WORKER_LOCAL.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(getattr(manipulation, op_name)(*args))